@@ -17,20 +17,51 @@ import json
 import glob
 import shutil
 import argparse
+import functools
 from pathlib import Path
 from datetime import datetime
-import frontmatter  # pip install python-frontmatter
-import difflib  # For comparing changes
 import hashlib  # For creating hashes of content to detect changes
 
+# Use rapidfuzz to pre-filter similarity checks when available
+try:
+    from rapidfuzz.fuzz import ratio as _fuzz_ratio  # pip install rapidfuzz (optional)
+except ImportError:
+    _fuzz_ratio = None
+
+# Use orjson to parse JSON files when available
+try:
+    import orjson  # pip install orjson (optional)
+except ImportError:
+    orjson = None
+
+# Use the LibYAML parser and emitter when available
+try:
+    from yaml import CSafeLoader as _YamlLoader, CSafeDumper as _YamlDumper
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader, SafeDumper as _YamlDumper
+
+# Pre-compiled patterns used while parsing and converting every file
+_LOGSEQ_PROP_RE = re.compile(r'^([a-zA-Z0-9_-]+):: (.*)$', re.MULTILINE)
+_H2_RE = re.compile(r'^##[^\S\n]+(.*)$', re.MULTILINE)
+_BULLET_RE = re.compile(r'^[\s]*-\s*')
+_HEADING_RE = re.compile(r'^#+\s+')
+_PARA_SPLIT_RE = re.compile(r'\n\s*\n')
+_BLOCKQUOTE_RE = re.compile(r'^>\s*')
+_YAML_BOUNDARY_RE = re.compile(r'^-{3,}\s*$', re.MULTILINE)
+
 # Load the schema
 SCHEMA_FILE = os.path.join(os.path.dirname(__file__), '..', 'unified_note_schema.json')
 
+def load_json(file_path):
+    """Load a JSON file, using orjson when it is installed."""
+    with open(file_path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
 def load_schema():
     """Load the unified note schema."""
     try:
-        with open(SCHEMA_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        return load_json(SCHEMA_FILE)
     except FileNotFoundError:
         print(f"Warning: Schema file not found at {SCHEMA_FILE}. Using default schema.")
         return {
@@ -49,6 +80,12 @@ def load_schema():
 # Global schema
 SCHEMA = load_schema()
 
+@functools.lru_cache(maxsize=None)
+def get_section_schema(note_type, section_name):
+    """Get the schema for a section of a note type, falling back to the generic note type."""
+    type_schema = SCHEMA["note_types"].get(note_type, SCHEMA["note_types"]["note"])
+    return type_schema.get("sections", {}).get(section_name, {})
+
 # Configuration
 CONFIG = {
     "logseq": {
@@ -86,69 +123,86 @@ CONFIG = {
     }
 }
 
-def parse_frontmatter(file_path):
-    """Parse frontmatter from a markdown file, handling both YAML and Logseq property formats."""
+# Manifest of previously synced files, used to skip files that haven't changed
+MANIFEST_FILE = '.mycelium_sync_cache.json'
+
+# Smallest number of files worth syncing in parallel worker processes
+MIN_PARALLEL_FILES = 16
+
+# Config and generated folders that are never searched for notes
+SKIP_DIRS = {'.obsidian', '_site', '.quarto'}
+
+# Directories already created by this process, so each is only made once
+_created_dirs = set()
+
+def split_yaml_frontmatter(content):
+    """Split YAML frontmatter from content, following python-frontmatter's rules."""
+    content = content.strip()
+    
+    # Frontmatter needs an opening and a closing delimiter line
+    parts = _YAML_BOUNDARY_RE.split(content, 2)
+    if not _YAML_BOUNDARY_RE.match(content) or len(parts) < 3:
+        return {}, content
+    
+    metadata = yaml.load(parts[1], Loader=_YamlLoader)
+    if not isinstance(metadata, dict):
+        metadata = {}
+    return metadata, parts[2].strip()
+
+def extract_sections(content):
+    """Extract sections from the content based on markdown headings."""
+    sections = {}
+    headings = list(_H2_RE.finditer(content))  # Level 2 headings
+    if not headings:
+        return {"content": content.strip()}
+    
+    # Add main content before the first heading
+    if headings[0].start() > 0:
+        sections["content"] = content[:headings[0].start()].strip()
+    
+    # Each section runs from the end of its heading line to the newline before
+    # the next heading, so a heading with no lines below it yields an empty slice
+    section_ends = [heading.start() - 1 for heading in headings[1:]] + [len(content)]
+    for heading, section_end in zip(headings, section_ends):
+        section_content = content[heading.end():section_end]
+        if section_content:
+            sections[heading.group(1).lower().replace(' ', '_')] = section_content.strip()
+    
+    return sections
+
+def parse_document(file_path):
+    """Parse frontmatter and sections from a markdown file, handling both YAML and Logseq property formats."""
     try:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
-            
+        
         # Check if this is a Logseq file (properties with :: syntax)
-        logseq_properties = {}
         if not content.startswith('---'):
             # Look for Logseq properties pattern: property:: value
-            property_pattern = re.compile(r'^([a-zA-Z0-9_-]+):: (.*)$', re.MULTILINE)
-            matches = property_pattern.findall(content)
+            metadata = dict(_LOGSEQ_PROP_RE.findall(content))
             
-            for key, value in matches:
-                logseq_properties[key] = value
-                
             # Remove properties from content
-            content = property_pattern.sub('', content)
-            return logseq_properties, content.strip()
+            content = _LOGSEQ_PROP_RE.sub('', content).strip()
         else:
             # Standard YAML frontmatter
-            post = frontmatter.loads(content)
-            return post.metadata, post.content
+            metadata, content = split_yaml_frontmatter(content)
     except Exception as e:
         print(f"Error parsing frontmatter in {file_path}: {e}")
-        return {}, ""
-
-def extract_sections(content):
-    """Extract sections from the content based on markdown headings."""
-    sections = {}
-    current_section = "content"
-    section_content = []
-    
-    lines = content.split('\n')
-    for line in lines:
-        if re.match(r'^##\s+', line):  # Level 2 heading
-            if section_content:
-                sections[current_section] = '\n'.join(section_content).strip()
-                section_content = []
-            current_section = re.sub(r'^##\s+', '', line).lower().replace(' ', '_')
-        else:
-            section_content.append(line)
+        metadata, content = {}, ""
     
-    # Add the last section
-    if section_content:
-        sections[current_section] = '\n'.join(section_content).strip()
-    
-    return sections
+    return metadata, extract_sections(content)
 
 def get_section_hash(section_content):
     """Generate a hash of section content to detect changes."""
-    return hashlib.md5(section_content.encode('utf-8')).hexdigest()
+    return hashlib.blake2b(section_content.encode('utf-8'), digest_size=16).digest()
 
 def determine_sync_direction(source_sections, target_sections, note_type):
     """Determine which sections should be synced and in which direction."""
     sync_directions = {}
+    common_sections = source_sections.keys() & target_sections.keys()
     
-    # Get schema for this note type
-    type_schema = SCHEMA["note_types"].get(note_type, SCHEMA["note_types"]["note"])
-    sections_schema = type_schema.get("sections", {})
-    
-    for section_name in set(list(source_sections.keys()) + list(target_sections.keys())):
-        section_schema = sections_schema.get(section_name, {"sync": True})
+    for section_name in source_sections.keys() | target_sections.keys():
+        section_schema = get_section_schema(note_type, section_name)
         
         # Skip sections that shouldn't be synced
         if not section_schema.get("sync", True):
@@ -163,7 +217,7 @@ def determine_sync_direction(source_sections, target_sections, note_type):
             continue
         
         # Both exist - determine which is newer based on content
-        if section_name in source_sections and section_name in target_sections:
+        if section_name in common_sections:
             source_hash = get_section_hash(source_sections[section_name])
             target_hash = get_section_hash(target_sections[section_name])
             
@@ -171,10 +225,26 @@ def determine_sync_direction(source_sections, target_sections, note_type):
                 sync_directions[section_name] = "none"  # No change needed
             else:
                 # Check for substantive changes using diff ratio
-                similarity = difflib.SequenceMatcher(None, 
-                                                    source_sections[section_name], 
-                                                    target_sections[section_name]).ratio()
+                source_text = source_sections[section_name]
+                target_text = target_sections[section_name]
+                similarity = 0.0
+
+                # The length ratio is a cheap upper bound on both similarity
+                # measures, so only compare content when it can exceed 0.9
+                shorter = min(len(source_text), len(target_text))
+                length_bound = 2.0 * shorter / (len(source_text) + len(target_text))
                 
+                # rapidfuzz's ratio is a longest-common-subsequence score, which is never
+                # below difflib's, so it can rule a pair out cheaply; difflib always decides
+                # so the result doesn't depend on which packages are installed
+                if length_bound > 0.9 and (_fuzz_ratio is None or
+                                           _fuzz_ratio(source_text, target_text, score_cutoff=90) > 90):
+                    import difflib  # Only needed when a full comparison is required
+                    matcher = difflib.SequenceMatcher(None, source_text, target_text)
+                    # quick_ratio() is another upper bound on ratio()
+                    if matcher.quick_ratio() > 0.9:
+                        similarity = matcher.ratio()
+
                 if similarity > 0.9:  # Very similar content
                     sync_directions[section_name] = "none"
                 else:
@@ -200,19 +270,21 @@ def convert_bullet_to_paragraph(content, platform="obsidian"):
     # Split into lines
     lines = content.split('\n')
     paragraphs = []
-    current_paragraph = ""
+    current_paragraph = []  # Parts of the paragraph, joined with spaces when done
     in_code_block = False
     
     for line in lines:
+        stripped = line.strip()
+        
         # Skip empty lines
-        if not line.strip():
+        if not stripped:
             if current_paragraph:
-                paragraphs.append(current_paragraph)
-                current_paragraph = ""
+                paragraphs.append(' '.join(current_paragraph))
+                current_paragraph = []
             continue
             
         # Preserve code blocks
-        if line.strip().startswith('```'):
+        if stripped.startswith('```'):
             in_code_block = not in_code_block
             paragraphs.append(line)
             continue
@@ -222,45 +294,49 @@ def convert_bullet_to_paragraph(content, platform="obsidian"):
             continue
         
         # If it's a heading, add it directly
-        if line.strip().startswith('#'):
+        if stripped.startswith('#'):
             if current_paragraph:
-                paragraphs.append(current_paragraph)
-                current_paragraph = ""
+                paragraphs.append(' '.join(current_paragraph))
+                current_paragraph = []
             paragraphs.append(line)
             continue
             
         # Remove bullet points and indentation
-        clean_line = re.sub(r'^[\s]*-\s*', '', line)
+        clean_line = line.lstrip()
+        if clean_line.startswith('-'):
+            clean_line = clean_line[1:].lstrip()
+        else:
+            clean_line = line  # Not a bullet, keep the line as is
         
         # If it's a sub-bullet, make it part of the current paragraph
         if line.startswith('  ') or line.startswith('\t'):
             if current_paragraph:
-                current_paragraph += " " + clean_line
-            else:
-                current_paragraph = clean_line
+                current_paragraph.append(clean_line)
+            elif clean_line:
+                current_paragraph = [clean_line]
         else:
             # New top-level bullet becomes a new paragraph
             if current_paragraph:
-                paragraphs.append(current_paragraph)
-            current_paragraph = clean_line
+                paragraphs.append(' '.join(current_paragraph))
+            current_paragraph = [clean_line] if clean_line else []
     
     # Add the last paragraph
     if current_paragraph:
-        paragraphs.append(current_paragraph)
+        paragraphs.append(' '.join(current_paragraph))
         
     return '\n\n'.join(paragraphs)
 
 def convert_paragraph_to_bullet(content):
     """Convert paragraphs to bullet points for Logseq."""
     # Split content into paragraphs
-    paragraphs = re.split(r'\n\s*\n', content)
+    paragraphs = _PARA_SPLIT_RE.split(content)
     result = []
     
     for para in paragraphs:
         lines = para.strip().split('\n')
         
         # Check if it's a heading
-        if lines and re.match(r'^#+\s+', lines[0]):
+        if lines and _HEADING_RE.match(lines[0]):
             result.append(lines[0])
             lines = lines[1:]
             if lines:
@@ -281,11 +357,12 @@ def convert_paragraph_to_bullet(content):
     
     return '\n'.join(result)
 
+# Notes often share boilerplate sections, so conversions are memoized
+@functools.lru_cache(maxsize=8192)
 def convert_section_format(section_content, note_type, section_name, source_format, target_format):
     """Convert section content between formats based on schema."""
     # Get schema for this note type and section
-    type_schema = SCHEMA["note_types"].get(note_type, SCHEMA["note_types"]["note"])
-    section_schema = type_schema.get("sections", {}).get(section_name, {})
+    section_schema = get_section_schema(note_type, section_name)
     
     source_format_type = section_schema.get(f"{source_format}_format", "bullets")
     target_format_type = section_schema.get(f"{target_format}_format", "paragraphs")
@@ -302,11 +379,11 @@ def convert_section_format(section_content, note_type, section_name, source_form
     elif source_format_type == "bullets" and target_format_type == "blockquotes":
         # Convert bullets to blockquotes
         lines = section_content.split('\n')
-        return '\n'.join([f"> {re.sub(r'^[\s]*-\s*', '', line)}" for line in lines])
+        return '\n'.join([f"> {_BULLET_RE.sub('', line)}" for line in lines])
     elif source_format_type == "blockquotes" and target_format_type == "bullets":
         # Convert blockquotes to bullets
         lines = section_content.split('\n')
-        return '\n'.join([f"- {re.sub(r'^>\s*', '', line)}" for line in lines])
+        return '\n'.join([f"- {_BLOCKQUOTE_RE.sub('', line)}" for line in lines])
     
     # Default: return original content
     return section_content
@@ -502,27 +579,101 @@ def reconstruct_content(sections):
     
     return "\n\n".join(content)
 
+def load_manifest():
+    """Load the sync manifest from the previous run."""
+    try:
+        manifest = load_json(MANIFEST_FILE)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {"pairs": {}}
+    
+    # Entries from before pairs were keyed by direction can't be attributed to a source platform
+    manifest["pairs"] = {key: pair for key, pair in manifest.get("pairs", {}).items() if "->" in key}
+    return manifest
+
+def save_manifest(manifest):
+    """Atomically write the sync manifest."""
+    temp_file = MANIFEST_FILE + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    os.replace(temp_file, MANIFEST_FILE)
+
+def get_file_hash(file_path):
+    """Generate a hash of the raw file bytes to detect changes."""
+    with open(file_path, 'rb') as f:
+        return hashlib.blake2b(f.read(), digest_size=16).hexdigest()
+
+def get_file_state(file_path):
+    """Get the [mtime_ns, size, hash] state of a file for the manifest."""
+    st = os.stat(file_path)
+    return [st.st_mtime_ns, st.st_size, get_file_hash(file_path)]
+
+def file_matches_state(file_path, state, st=None):
+    """Check whether a file is unchanged since its state was recorded."""
+    if not state:
+        return False
+    try:
+        st = st or os.stat(file_path)
+    except FileNotFoundError:
+        return False
+    
+    if [st.st_mtime_ns, st.st_size] == state[:2]:
+        return True
+    
+    # Touched but possibly unchanged - fall back to comparing the content
+    if st.st_size == state[1] and get_file_hash(file_path) == state[2]:
+        state[0] = st.st_mtime_ns
+        return True
+    return False
+
+def manifest_key(source_file, source_platform, target_platform):
+    """Key a manifest entry by sync direction, so directions sharing a target don't collide."""
+    return f"{source_platform}->{target_platform}:{source_file}"
+
+def is_synced(manifest, source_file, source_platform, target_platform, source_stat=None):
+    """Check whether neither a file nor its target changed since it was last synced."""
+    pair = manifest["pairs"].get(manifest_key(source_file, source_platform, target_platform))
+    return bool(pair) and file_matches_state(source_file, pair["source"], source_stat) \
+        and file_matches_state(pair["target_file"], pair["target"])
+
+def record_sync(manifest, source_file, source_platform, target_platform, target_file):
+    """Record the current state of a synced file and its target in the manifest."""
+    manifest["pairs"][manifest_key(source_file, source_platform, target_platform)] = {
+        "source": get_file_state(source_file),
+        "target_file": target_file,
+        "target": get_file_state(target_file)
+    }
+
+def sync_file_if_changed(source_file, source_platform, target_platform, manifest, force=False, verbose=False):
+    """Sync a single file unless neither it nor its target changed since the last sync."""
+    if not force and is_synced(manifest, source_file, source_platform, target_platform):
+        print(f"Unchanged since last sync: {source_file}")
+        return
+    
+    target_file = sync_file(source_file, source_platform, target_platform, verbose)
+    record_sync(manifest, source_file, source_platform, target_platform, target_file)
+
+def ensure_directory(directory):
+    """Create a directory unless this process already created it."""
+    if directory not in _created_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _created_dirs.add(directory)
+
 def sync_file(source_file, source_platform, target_platform, verbose=False):
     """Sync a single file between platforms with bidirectional support."""
     if verbose:
         print(f"\nSyncing file: {source_file}")
         print(f"  From: {source_platform} to {target_platform}")
     
-    # Parse source frontmatter and content
-    source_meta, source_content = parse_frontmatter(source_file)
+    # Parse source frontmatter and sections
+    source_meta, source_sections = parse_document(source_file)
     
     if verbose:
         print(f"  Source metadata: {source_meta}")
+        print(f"  Source sections: {list(source_sections.keys())}")
     
     # Get note type for schema reference
     note_type = source_meta.get("type", "note").lower()
     
-    # Extract sections from source content
-    source_sections = extract_sections(source_content)
-    
-    if verbose:
-        print(f"  Source sections: {list(source_sections.keys())}")
-    
     # Initialize sync_directions
     sync_directions = {}
     
@@ -555,15 +706,14 @@ def sync_file(source_file, source_platform, target_platform, verbose=False):
         print(f"  Target file: {target_file}")
     
     # Create target directory if it doesn't exist
-    os.makedirs(os.path.dirname(target_file), exist_ok=True)
+    ensure_directory(os.path.dirname(target_file))
     
     # Get target content if it exists
     if os.path.exists(target_file):
         if verbose:
             print(f"  Target file exists, merging content")
         
-        target_meta, target_content = parse_frontmatter(target_file)
-        target_sections = extract_sections(target_content)
+        target_meta, target_sections = parse_document(target_file)
         
         if verbose:
             print(f"  Target metadata: {target_meta}")
@@ -601,26 +751,18 @@ def sync_file(source_file, source_platform, target_platform, verbose=False):
     # Reconstruct the full content
     merged_content = reconstruct_content(merged_sections)
     
-    # Write the file with the appropriate format based on platform
+    # Build the file with the appropriate format based on platform
     if target_platform == 'logseq':
-        # Write with Logseq property format
-        with open(target_file, 'w', encoding='utf-8') as f:
-            # Write properties at the top
-            for key, value in merged_meta.items():
-                f.write(f"{key}:: {value}\n")
-            
-            # Add a blank line if we have properties
-            if merged_meta:
-                f.write("\n")
-                
-            f.write(merged_content)
+        # Logseq property format, with a blank line after the properties
+        properties = ''.join(f"{key}:: {value}\n" for key, value in merged_meta.items())
+        payload = f"{properties}\n{merged_content}" if properties else merged_content
     else:
-        # Write with standard YAML frontmatter
-        with open(target_file, 'w', encoding='utf-8') as f:
-            f.write("---\n")
-            f.write(yaml.dump(merged_meta, default_flow_style=False))
-            f.write("---\n\n")
-            f.write(merged_content)
+        # Standard YAML frontmatter
+        frontmatter_text = yaml.dump(merged_meta, Dumper=_YamlDumper, default_flow_style=False)
+        payload = f"---\n{frontmatter_text}---\n\n{merged_content}"
+    
+    with open(target_file, 'w', encoding='utf-8') as f:
+        f.write(payload)
     
     print(f"Synced: {source_file} -> {target_file}")
     
@@ -630,68 +772,111 @@ def sync_file(source_file, source_platform, target_platform, verbose=False):
         if os.path.exists(target_file) and any(d == "target_to_source" for d in sync_directions.values()):
             print(f"Syncing back: {target_file} -> {source_file}")
             sync_file(target_file, target_platform, source_platform, verbose)
+    
+    return target_file
+
+def walk_markdown(root, extensions=('.md',)):
+    """Yield DirEntry objects for markdown files under root, skipping hidden and generated folders."""
+    try:
+        entries = os.scandir(root)
+    except FileNotFoundError:
+        return
+    
+    with entries:
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir():
+                if entry.name not in SKIP_DIRS:
+                    yield from walk_markdown(entry.path, extensions)
+            elif entry.name.endswith(extensions) and entry.is_file():
+                yield entry
+
+def sync_file_group(source_files, source_platform, target_platform):
+    """Sync a group of files in order, returning their target paths."""
+    return [sync_file(source_file, source_platform, target_platform) for source_file in source_files]
+
+def sync_files(source_files, source_platform, target_platform, verbose=False):
+    """Sync files across worker processes, yielding (source_file, target_file) pairs."""
+    # Syncing serially keeps verbose output readable and skips the pool
+    # startup cost for small batches
+    if verbose or len(source_files) < MIN_PARALLEL_FILES:
+        for source_file in source_files:
+            yield source_file, sync_file(source_file, source_platform, target_platform, verbose)
+        return
+    
+    # Files with the same name can map to the same target path, so each
+    # group of same-named files is synced in order by a single worker
+    groups = {}
+    for source_file in source_files:
+        name = os.path.splitext(os.path.basename(source_file))[0]
+        groups.setdefault(name, []).append(source_file)
+    groups = list(groups.values())
+    
+    from concurrent.futures import ProcessPoolExecutor  # Only needed for large batches
+    
+    sync_group = functools.partial(sync_file_group, source_platform=source_platform,
+                                   target_platform=target_platform)
+    chunksize = max(1, len(groups) // (4 * (os.cpu_count() or 1)))
+    with ProcessPoolExecutor() as pool:
+        for group, target_files in zip(groups, pool.map(sync_group, groups, chunksize=chunksize)):
+            yield from zip(group, target_files)
 
-def sync_all_files(source_platform, target_platform, bidirectional=False, verbose=False):
+def sync_all_files(source_platform, target_platform, bidirectional=False, verbose=False, force=False):
     """Sync all files from source to target platform, handling platform-specific folder structures."""
+    manifest = load_manifest()
+    
     # Handle different source platforms
-    if source_platform == 'content':
-        source_dir = CONFIG['logseq']['source_dir']
-        search_pattern = os.path.join(source_dir, "**/*.md")
-    elif source_platform == 'obsidian':
-        # For Obsidian, we need to handle its folder structure
-        source_dir = CONFIG[source_platform]['target_dir']
-        # Search in all subfolders of Obsidian
-        search_pattern = os.path.join(source_dir, "**/*.md")
-    elif source_platform == 'quarto':
+    if source_platform == 'quarto':
         # For Quarto, we need to handle both posts and visualizations
-        source_dir = os.path.dirname(CONFIG[source_platform]['target_dir'])  # Get the quarto base directory
         # Create a list to collect files from multiple directories
-        quarto_files = []
+        entries = []
         # Look in both posts and visualizations directories
-        quarto_files.extend(glob.glob(os.path.join(CONFIG[source_platform]['target_dir'], "**/*.md"), recursive=True))
-        quarto_files.extend(glob.glob(os.path.join(CONFIG[source_platform]['target_dir'], "**/*.qmd"), recursive=True))
-        quarto_files.extend(glob.glob(os.path.join(CONFIG[source_platform]['visualization_dir'], "**/*.md"), recursive=True))
-        quarto_files.extend(glob.glob(os.path.join(CONFIG[source_platform]['visualization_dir'], "**/*.qmd"), recursive=True))
+        entries.extend(walk_markdown(CONFIG[source_platform]['target_dir'], ('.md', '.qmd')))
+        entries.extend(walk_markdown(CONFIG[source_platform]['visualization_dir'], ('.md', '.qmd')))
         
         if verbose:
-            print(f"Found {len(quarto_files)} files in Quarto directories")
-            for file in quarto_files:
-                print(f"  - {file}")
-        
-        # Process each Quarto file
-        for file_path in quarto_files:
-            # Skip files in specific directories that should be ignored
-            if '/_site/' in file_path or '/.quarto/' in file_path:
-                if verbose:
-                    print(f"Skipping generated file: {file_path}")
-                continue
-                
-            # Apply the sync process
-            if verbose:
-                print(f"Processing Quarto file: {file_path}")
-            sync_file(file_path, source_platform, target_platform, verbose)
-        
-        print(f"Synchronized Quarto files to {target_platform}")
-        return
+            print(f"Found {len(entries)} files in Quarto directories")
+            for entry in entries:
+                print(f"  - {entry.path}")
     else:
-        source_dir = CONFIG[source_platform]['source_dir']
-        search_pattern = os.path.join(source_dir, "**/*.md")
+        if source_platform == 'content':
+            source_dir = CONFIG['logseq']['source_dir']
+        elif source_platform == 'obsidian':
+            # For Obsidian, we need to handle its folder structure
+            # All subfolders of Obsidian are searched below
+            source_dir = CONFIG[source_platform]['target_dir']
+        else:
+            source_dir = CONFIG[source_platform]['source_dir']
+        
+        # Find all markdown files in source directory and its subdirectories
+        entries = walk_markdown(source_dir)
     
-    # For platforms other than Quarto, use the normal approach
-    # Find all markdown files in source directory and its subdirectories
-    for file_path in glob.glob(search_pattern, recursive=True):
-        # Skip files in specific directories that should be ignored
-        if '.obsidian/' in file_path or '/_site/' in file_path or '/.quarto/' in file_path:
+    # Collect the files that need syncing
+    pending_files = []
+    for entry in entries:
+        file_path = entry.path
+        
+        # Skip files that haven't changed since the last sync
+        if not force and is_synced(manifest, file_path, source_platform, target_platform, entry.stat()):
             if verbose:
-                print(f"Skipping config/generated file: {file_path}")
+                print(f"Unchanged since last sync: {file_path}")
             continue
-            
-        # Apply the sync process
+        
         if verbose:
             print(f"Processing file: {file_path}")
-        sync_file(file_path, source_platform, target_platform, verbose)
+        pending_files.append(file_path)
     
-    print(f"Synchronized all files from {source_platform} to {target_platform}")
+    # Apply the sync process; files synced before a failure are still recorded
+    try:
+        for source_file, target_file in sync_files(pending_files, source_platform, target_platform, verbose):
+            record_sync(manifest, source_file, source_platform, target_platform, target_file)
+    finally:
+        save_manifest(manifest)
+    if source_platform == 'quarto':
+        print(f"Synchronized Quarto files to {target_platform}")
+    else:
+        print(f"Synchronized all files from {source_platform} to {target_platform}")
 
 def sync_assets(source_dir, platforms):
     """Sync assets to all platform directories."""
@@ -707,52 +892,81 @@ def sync_assets(source_dir, platforms):
         elif platform == 'quarto':
             assets_target = os.path.join(os.path.dirname(CONFIG[platform]['target_dir']), "assets")
         
-        os.makedirs(assets_target, exist_ok=True)
+        ensure_directory(assets_target)
         
         # Copy all assets
         for asset in glob.glob(os.path.join(assets_source, "**"), recursive=True):
             if os.path.isfile(asset):
                 relative_path = os.path.relpath(asset, assets_source)
                 target_path = os.path.join(assets_target, relative_path)
-                os.makedirs(os.path.dirname(target_path), exist_ok=True)
+                ensure_directory(os.path.dirname(target_path))
                 shutil.copy2(asset, target_path)
                 print(f"Synced asset: {relative_path}")
 
 def create_folder_structure():
     """Create the necessary folder structure for all platforms."""
-    # Create main directories
+    # Collect every directory first; several platforms share folders
+    directories = []
+    
+    # Main directories
     for platform, config in CONFIG.items():
-        os.makedirs(config['target_dir'], exist_ok=True)
+        directories.append(config['target_dir'])
         
-        # Create platform-specific folder structure
+        # Platform-specific folder structure
         if platform == 'obsidian':
-            for folder in config['folders'].values():
-                os.makedirs(os.path.join(config['target_dir'], folder), exist_ok=True)
+            target_dir = config['target_dir']
+            directories.extend(os.path.join(target_dir, folder) for folder in config['folders'].values())
         elif platform == 'quarto':
-            os.makedirs(config['visualization_dir'], exist_ok=True)
+            directories.append(config['visualization_dir'])
     
-    # Create template directories
+    # Template directories
     for platform, config in CONFIG.items():
         templates_dir = config.get('templates_dir')
         if templates_dir:
-            os.makedirs(templates_dir, exist_ok=True)
+            directories.append(templates_dir)
     
-    # Create content directory if it doesn't exist
-    os.makedirs(CONFIG['logseq']['source_dir'], exist_ok=True)
+    # Content directory
+    content_dir = CONFIG['logseq']['source_dir']
+    directories.append(content_dir)
     
-    # Create assets directory
-    os.makedirs(os.path.join(os.path.dirname(CONFIG['logseq']['source_dir']), "assets"), exist_ok=True)
+    # Assets directory
+    directories.append(os.path.join(os.path.dirname(content_dir), "assets"))
     
-    # Ensure schema directory exists - create full path if needed
+    # Schema directory - create full path if needed
     schema_dir = os.path.dirname(SCHEMA_FILE)
     if schema_dir and schema_dir != "":
-        os.makedirs(schema_dir, exist_ok=True)
+        directories.append(schema_dir)
+    
+    # Create each distinct directory once
+    for directory in dict.fromkeys(directories):
+        ensure_directory(directory)
     
     # Create schema file if it doesn't exist
     if not os.path.exists(SCHEMA_FILE):
         with open(SCHEMA_FILE, 'w', encoding='utf-8') as f:
             json.dump(SCHEMA, f, indent=2)
 
+def resolve_source_file(source, file_name):
+    """Find a file relative to the source platform's directories, or None if it doesn't exist."""
+    if source == 'content':
+        candidates = [os.path.join(CONFIG['logseq']['source_dir'], file_name)]
+    elif source == 'obsidian':
+        # For Obsidian, look in all subfolders, then the base directory
+        obsidian_dir = CONFIG['obsidian']['target_dir']
+        candidates = [os.path.join(obsidian_dir, folder, file_name)
+                      for folder in CONFIG['obsidian']['folders'].values()]
+        candidates.append(os.path.join(obsidian_dir, file_name))
+    elif source == 'quarto':
+        # For Quarto, check both posts and visualizations, with and without the .qmd extension
+        qmd_name = f"{os.path.splitext(file_name)[0]}.qmd"
+        candidates = [os.path.join(CONFIG['quarto'][quarto_dir], name)
+                      for quarto_dir in ('target_dir', 'visualization_dir')
+                      for name in (file_name, qmd_name)]
+    else:
+        candidates = [os.path.join(CONFIG[source]['source_dir'], file_name)]
+    
+    return next((candidate for candidate in candidates if os.path.isfile(candidate)), None)
+
 def main():
     parser = argparse.ArgumentParser(description='Bidirectional sync between Logseq, Obsidian, and Quarto')
     parser.add_argument('--source', choices=['logseq', 'obsidian', 'quarto', 'content'], 
@@ -767,6 +981,8 @@ def main():
                         help='Sync a specific file (relative to source directory)')
     parser.add_argument('--verbose', action='store_true',
                         help='Enable verbose output')
+    parser.add_argument('--force', action='store_true',
+                        help='Re-sync all files, even if unchanged since the last sync')
     args = parser.parse_args()
     
     verbose = args.verbose
@@ -791,102 +1007,49 @@ def main():
         if verbose:
             print(f"Syncing specific file: {args.file}")
         
-        # Handle 'content' as a special case
-        if source == 'content':
-            file_path = os.path.join(CONFIG['logseq']['source_dir'], args.file)
-        elif source == 'obsidian':
-            # For Obsidian, look in all subfolders
-            obsidian_dir = CONFIG['obsidian']['target_dir']
-            found = False
-            for folder in CONFIG['obsidian']['folders'].values():
-                test_path = os.path.join(obsidian_dir, folder, args.file)
-                if os.path.exists(test_path):
-                    file_path = test_path
-                    found = True
-                    break
-            if not found:
-                # Try just the base directory
-                test_path = os.path.join(obsidian_dir, args.file)
-                if os.path.exists(test_path):
-                    file_path = test_path
-                    found = True
-            if not found:
-                print(f"Error: File not found in any Obsidian folder: {args.file}")
-                return
-        elif source == 'quarto':
-            # For Quarto, check both posts and visualizations
-            posts_path = os.path.join(CONFIG['quarto']['target_dir'], args.file)
-            if os.path.exists(posts_path):
-                file_path = posts_path
-            else:
-                # Try with .qmd extension
-                posts_qmd_path = os.path.join(CONFIG['quarto']['target_dir'], f"{os.path.splitext(args.file)[0]}.qmd")
-                if os.path.exists(posts_qmd_path):
-                    file_path = posts_qmd_path
-                else:
-                    # Try visualizations folder
-                    viz_path = os.path.join(CONFIG['quarto']['visualization_dir'], args.file)
-                    if os.path.exists(viz_path):
-                        file_path = viz_path
-                    else:
-                        # Try with .qmd extension
-                        viz_qmd_path = os.path.join(CONFIG['quarto']['visualization_dir'], f"{os.path.splitext(args.file)[0]}.qmd")
-                        if os.path.exists(viz_qmd_path):
-                            file_path = viz_qmd_path
-                        else:
-                            print(f"Error: File not found in any Quarto location: {args.file}")
-                            return
-        else:
-            file_path = os.path.join(CONFIG[source]['source_dir'], args.file)
+        file_path = resolve_source_file(source, args.file)
+        if file_path is None:
+            locations = {'obsidian': 'any Obsidian folder', 'quarto': 'any Quarto location'}
+            print(f"Error: File not found in {locations.get(source, 'the source directory')}: {args.file}")
+            return
         
         if verbose:
             print(f"Full file path: {file_path}")
         
-        if not os.path.exists(file_path):
-            print(f"Error: File not found: {file_path}")
-            return
-        
-        if args.target == 'all':
-            for platform in ['logseq', 'obsidian', 'quarto']:
-                if platform != source:
-                    sync_file(file_path, source, platform, verbose)
-        else:
-            sync_file(file_path, source, args.target, verbose)
+        manifest = load_manifest()
+        try:
+            if args.target == 'all':
+                for platform in ['logseq', 'obsidian', 'quarto']:
+                    if platform != source:
+                        sync_file_if_changed(file_path, source, platform, manifest, args.force, verbose)
+            else:
+                sync_file_if_changed(file_path, source, args.target, manifest, args.force, verbose)
+        finally:
+            save_manifest(manifest)
         
         return
     
+    # Assets are synced from the source platform's directory
+    # Handle special cases for source directory
+    if source == 'content':
+        source_dir = CONFIG['logseq']['source_dir']
+    elif source == 'obsidian':
+        source_dir = CONFIG['obsidian']['target_dir']
+    elif source == 'quarto':
+        source_dir = os.path.dirname(CONFIG['quarto']['target_dir'])  # Use quarto root
+    else:
+        source_dir = CONFIG[source]['source_dir']
+    
     # Sync all files
     if args.target == 'all':
-        for platform in ['logseq', 'obsidian', 'quarto']:
-            if platform != source:
-                sync_all_files(source, platform, args.bidirectional, verbose)
+        target_platforms = [p for p in ['logseq', 'obsidian', 'quarto'] if p != source]
+        for platform in target_platforms:
+            sync_all_files(source, platform, args.bidirectional, verbose, args.force)
         
         # Sync assets to all platforms
-        # Handle special cases for source directory
-        if source == 'content':
-            source_dir = CONFIG['logseq']['source_dir']
-        elif source == 'obsidian':
-            source_dir = CONFIG['obsidian']['target_dir']
-        elif source == 'quarto':
-            source_dir = os.path.dirname(CONFIG['quarto']['target_dir'])  # Use quarto root
-        else:
-            source_dir = CONFIG[source]['source_dir']
-            
-        sync_assets(source_dir, 
-                   [p for p in ['logseq', 'obsidian', 'quarto'] if p != source])
+        sync_assets(source_dir, target_platforms)
     else:
-        sync_all_files(source, args.target, args.bidirectional, verbose)
-        
-        # Handle special cases for source directory
-        if source == 'content':
-            source_dir = CONFIG['logseq']['source_dir']
-        elif source == 'obsidian':
-            source_dir = CONFIG['obsidian']['target_dir']
-        elif source == 'quarto':
-            source_dir = os.path.dirname(CONFIG['quarto']['target_dir'])  # Use quarto root
-        else:
-            source_dir = CONFIG[source]['source_dir']
-            
+        sync_all_files(source, args.target, args.bidirectional, verbose, args.force)
         sync_assets(source_dir, [args.target])
     
     print("Sync completed!")
@@ -8,15 +8,22 @@ handling the different YAML frontmatter requirements for each platform.
 
 import os
 import re
-import yaml
-import glob
+import sys
 import shutil
+import json
+import atexit
+import logging
 import argparse
+import functools
 from pathlib import Path
-from datetime import datetime
-import frontmatter  # pip install python-frontmatter
-import git  # pip install GitPython
-import uuid
+from datetime import date, datetime
+
+log = logging.getLogger('notes_sync')
+
+# Pre-compiled patterns used while parsing and converting every file
+_LOGSEQ_PROP_RE = re.compile(r'^([a-zA-Z0-9_-]+):: (.*)$', re.MULTILINE)
+# Logseq block references ((block-id)) and page embeds {{embed [[page]]}}, matched in one pass
+_LOGSEQ_REF_RE = re.compile(r'\(\(([a-zA-Z0-9-]+)\)\)|\{\{embed \[\[([^\]]+)\]\]\}\}')
 
 # Configuration
 CONFIG = {
@@ -43,32 +50,122 @@ CONFIG = {
     }
 }
 
-def parse_frontmatter(file_path):
-    """Parse frontmatter from a markdown file, handling both YAML and Logseq property formats."""
+# Parsed frontmatter from previous runs, keyed by path and checked against [mtime_ns, size].
+# Only metadata is kept; bodies are re-read, which is cheap next to parsing the YAML.
+FM_CACHE_FILE = '.fm_cache.json'
+FM_CACHE_VERSION = 1
+
+# Loaded by main(), so importing this module never reads files from the working directory
+_fm_cache = {}
+_fm_cache_dirty = False
+
+# Smallest number of files worth syncing in worker threads
+MIN_PARALLEL_FILES = 16
+
+def _encode_date(value):
+    """Encode YAML dates and timestamps, which JSON has no type for."""
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, date):
+        return {'__date__': value.isoformat()}
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def _decode_date(obj):
+    """Decode dates and timestamps written by _encode_date."""
+    if len(obj) == 1:
+        if '__datetime__' in obj:
+            return datetime.fromisoformat(obj['__datetime__'])
+        if '__date__' in obj:
+            return date.fromisoformat(obj['__date__'])
+    return obj
+
+def load_fm_cache():
+    """Load the parsed frontmatter cache from the previous run, ignoring it if malformed or outdated."""
+    global _fm_cache
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        # Check if this is a Logseq file (properties with :: syntax)
-        logseq_properties = {}
-        if not content.startswith('---'):
-            # Look for Logseq properties pattern: property:: value
-            property_pattern = re.compile(r'^([a-zA-Z0-9_-]+):: (.*)$', re.MULTILINE)
-            matches = property_pattern.findall(content)
+        with open(FM_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f, object_hook=_decode_date)
+    except (OSError, ValueError):
+        return
+    if isinstance(cache, dict) and cache.get('version') == FM_CACHE_VERSION and isinstance(cache.get('files'), dict):
+        _fm_cache = cache['files']
+
+def save_fm_cache():
+    """Atomically write the parsed frontmatter cache if it changed."""
+    if not _fm_cache_dirty:
+        return
+    temp_file = FM_CACHE_FILE + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump({'version': FM_CACHE_VERSION, 'files': _fm_cache}, f, default=_encode_date)
+    os.replace(temp_file, FM_CACHE_FILE)
+
+def read_frontmatter(file_path):
+    """Read frontmatter from a markdown file, handling both YAML and Logseq property formats."""
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+        
+    # Check if this is a Logseq file (properties with :: syntax)
+    logseq_properties = {}
+    if not content.startswith('---'):
+        # Look for Logseq properties pattern: property:: value
+        matches = _LOGSEQ_PROP_RE.findall(content)
+        
+        for key, value in matches:
+            logseq_properties[key] = value
             
-            for key, value in matches:
-                logseq_properties[key] = value
-                
-            # Remove properties from content
-            content = property_pattern.sub('', content)
-            return logseq_properties, content.strip()
-        else:
-            # Standard YAML frontmatter
-            post = frontmatter.load(content)
-            return post.metadata, post.content
+        # Remove properties from content
+        content = _LOGSEQ_PROP_RE.sub('', content)
+        return logseq_properties, content.strip()
+    else:
+        # Standard YAML frontmatter
+        import frontmatter  # pip install python-frontmatter; only needed for YAML notes
+        post = frontmatter.loads(content)
+        return post.metadata, post.content
+
+def note_body(content):
+    """Return a note's body as read_frontmatter would, without parsing its frontmatter."""
+    if not content.startswith('---'):
+        return _LOGSEQ_PROP_RE.sub('', content).strip()
+    
+    # Split with python-frontmatter's own handler so the body always matches frontmatter.loads
+    from frontmatter.default_handlers import YAMLHandler
+    handler = YAMLHandler()
+    text = content.strip()
+    if not handler.detect(text):
+        return text
+    try:
+        return handler.split(text)[1].strip()
+    except ValueError:
+        return text
+
+def parse_frontmatter(file_path):
+    """Parse frontmatter from a markdown file, reusing the cached metadata if the file is unchanged."""
+    global _fm_cache_dirty
+    try:
+        st = os.stat(file_path)
+        stamp = [st.st_mtime_ns, st.st_size]
+        cached = _fm_cache.get(file_path)
+        if isinstance(cached, list) and len(cached) == 2 and cached[0] == stamp and isinstance(cached[1], dict):
+            # Only the metadata is cached; splitting off the body needs no YAML parsing
+            with open(file_path, 'r', encoding='utf-8') as f:
+                return cached[1], note_body(f.read())
+        
+        result = read_frontmatter(file_path)
     except Exception as e:
-        print(f"Error parsing frontmatter in {file_path}: {e}")
+        log.warning("Error parsing frontmatter in %s: %s", file_path, e)
         return {}, ""
+    
+    # Failed parses are not cached so the error is reported again next run; neither is
+    # metadata that doesn't survive a JSON round trip unchanged (e.g. non-string keys)
+    entry = [stamp, result[0]]
+    try:
+        cacheable = json.loads(json.dumps(entry, default=_encode_date), object_hook=_decode_date) == entry
+    except (TypeError, ValueError):
+        cacheable = False
+    if cacheable:
+        _fm_cache[file_path] = entry
+        _fm_cache_dirty = True
+    return result
 
 def merge_frontmatter(source_meta, target_meta, platform, file_path=None):
     """Merge frontmatter, prioritizing source while preserving platform-specific fields."""
@@ -99,112 +196,208 @@ def merge_frontmatter(source_meta, target_meta, platform, file_path=None):
     
     return merged
 
+def _obsidian_ref(match):
+    """Obsidian uses [[^block-id]] for block references and ![[page]] for embeds."""
+    block_id, page = match.groups()
+    return f'[[^{block_id}]]' if block_id is not None else f'![[{page}]]'
+
+def _quarto_ref(match):
+    """Quarto has no block references, so they become a placeholder; embeds become links."""
+    block_id, page = match.groups()
+    return '[*Block Reference*]' if block_id is not None else f'See: [{page}]({page})'
+
 def convert_logseq_syntax(content, target_platform):
     """Convert Logseq-specific syntax to target platform format."""
-    # Handle block references (e.g., ((block-id)) in Logseq)
+    # Handle block references (e.g., ((block-id)) in Logseq) and page embeds
     if target_platform == 'obsidian':
-        # Obsidian uses [[^block-id]] for block references
-        content = re.sub(r'\(\(([a-zA-Z0-9-]+)\)\)', r'[[^\1]]', content)
-        
-        # Convert page embeds
-        content = re.sub(r'\{\{embed \[\[([^\]]+)\]\]\}\}', r'![[&1]]', content)
+        content = _LOGSEQ_REF_RE.sub(_obsidian_ref, content)
     elif target_platform == 'quarto':
-        # For Quarto, we simply remove block references as they don't have a direct equivalent
-        content = re.sub(r'\(\(([a-zA-Z0-9-]+)\)\)', r'[*Block Reference*]', content)
-        
-        # Convert page embeds to markdown includes if possible or to links
-        content = re.sub(r'\{\{embed \[\[([^\]]+)\]\]\}\}', r'See: [\1](\1)', content)
+        content = _LOGSEQ_REF_RE.sub(_quarto_ref, content)
     
     # Handle Logseq bullet format (- item) for non-Logseq platforms
     # This is more complex and may need custom handling depending on the document structure
     
     return content
 
-def sync_files(source_dir, target_dir, platform):
-    """Sync files from source to target with proper frontmatter, handling both YAML and Logseq formats."""
-    os.makedirs(target_dir, exist_ok=True)
+def walk_markdown(root):
+    """Yield DirEntry objects for markdown files under root, skipping hidden files and folders."""
+    try:
+        entries = os.scandir(root)
+    except FileNotFoundError:
+        return
     
-    # Process all markdown files in source directory
-    for file_path in glob.glob(os.path.join(source_dir, "**/*.md"), recursive=True):
-        relative_path = os.path.relpath(file_path, source_dir)
-        target_path = os.path.join(target_dir, relative_path)
-        
-        # Create target directory if it doesn't exist
-        os.makedirs(os.path.dirname(target_path), exist_ok=True)
-        
-        # Parse source frontmatter and content
-        source_meta, source_content = parse_frontmatter(file_path)
-        
-        # Process Logseq-specific syntax if needed
-        if platform != 'logseq':
-            # Convert Logseq block references to other formats if needed
-            source_content = convert_logseq_syntax(source_content, platform)
+    with entries:
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir():
+                yield from walk_markdown(entry.path)
+            elif entry.name.endswith('.md') and entry.is_file():
+                yield entry
+
+def dump_yaml(data):
+    """Serialize frontmatter as YAML, using the LibYAML emitter when available."""
+    import yaml  # Only needed when writing YAML frontmatter
+    return yaml.dump(data, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper), default_flow_style=False)
+
+def _sync_one(file_path, relative_path, source_mtime, target_dir, platform):
+    """Sync a single markdown file to the target directory and return whether it was written."""
+    target_path = target_dir + os.sep + relative_path
+    
+    # Parse source frontmatter and content
+    source_meta, source_content = parse_frontmatter(file_path)
+    
+    # Process Logseq-specific syntax if needed
+    if platform != 'logseq':
+        # Convert Logseq block references to other formats if needed
+        source_content = convert_logseq_syntax(source_content, platform)
+    
+    # Check if target file exists; one stat gives both existence and mtime
+    try:
+        target_stat = os.stat(target_path)
+    except FileNotFoundError:
+        target_stat = None
+    
+    if target_stat is not None:
+        # Parse target frontmatter
+        target_meta, target_content = parse_frontmatter(target_path)
         
-        # Check if target file exists
-        if os.path.exists(target_path):
-            # Parse target frontmatter
-            target_meta, target_content = parse_frontmatter(target_path)
-            
-            # Determine which content is newer
-            # For simplicity, we'll just check file modification times
-            # A more sophisticated approach would diff the actual content
-            if os.path.getmtime(file_path) > os.path.getmtime(target_path):
-                content_to_use = source_content
-            else:
-                content_to_use = target_content
-                
-            # Merge frontmatter
-            merged_meta = merge_frontmatter(source_meta, target_meta, platform, file_path)
-        else:
-            # Target doesn't exist, use source content and adapt frontmatter
+        # Determine which content is newer
+        # For simplicity, we'll just check file modification times
+        # A more sophisticated approach would diff the actual content
+        if source_mtime > target_stat.st_mtime:
             content_to_use = source_content
-            merged_meta = merge_frontmatter(source_meta, {}, platform, file_path)
-        
-        # Write the file with the appropriate format based on platform
-        if platform == 'logseq':
-            # Write with Logseq property format
-            with open(target_path, 'w', encoding='utf-8') as f:
-                # Write properties at the top
-                for key, value in merged_meta.items():
-                    f.write(f"{key}:: {value}\n")
-                
-                # Add a blank line if we have properties
-                if merged_meta:
-                    f.write("\n")
-                    
-                f.write(content_to_use)
         else:
-            # Write with standard YAML frontmatter
-            with open(target_path, 'w', encoding='utf-8') as f:
-                f.write("---\n")
-                f.write(yaml.dump(merged_meta, default_flow_style=False))
-                f.write("---\n\n")
-                f.write(content_to_use)
+            content_to_use = target_content
+            
+        # Merge frontmatter
+        merged_meta = merge_frontmatter(source_meta, target_meta, platform, file_path)
+        
+        # Nothing to write if neither the frontmatter nor the body would change
+        if merged_meta == target_meta and content_to_use == target_content:
+            log.debug("Unchanged: %s", relative_path)
+            return False
+    else:
+        # Target doesn't exist, use source content and adapt frontmatter
+        content_to_use = source_content
+        merged_meta = merge_frontmatter(source_meta, {}, platform, file_path)
+    
+    try:
+        with open(target_path, 'rb') as f:
+            existing = f.read()
+    except FileNotFoundError:
+        existing = None
+    
+    # Build the file with the appropriate format based on platform
+    if platform == 'logseq':
+        # Logseq property format, with a blank line after any properties
+        properties = "".join(f"{key}:: {value}\n" for key, value in merged_meta.items())
+        output = (properties + ("\n" if merged_meta else "") + content_to_use).encode('utf-8')
+    else:
+        # Standard YAML frontmatter
+        output = ("---\n" + dump_yaml(merged_meta) + "---\n\n" + content_to_use).encode('utf-8')
+    
+    # Leave the target untouched if it already has exactly this content
+    if existing == output:
+        log.debug("Unchanged: %s", relative_path)
+        return False
+    
+    with open(target_path, 'wb') as f:
+        f.write(output)
+    
+    log.debug("Synced: %s -> %s", relative_path, target_path)
+    return True
+
+def sync_files(source_dir, target_dir, platform, files=None):
+    """Sync files from source to target with proper frontmatter, handling both YAML and Logseq formats.
+    
+    If files is given, only those paths under source_dir are synced instead of walking the whole tree.
+    """
+    os.makedirs(target_dir, exist_ok=True)
+    
+    # Walked and listed paths all start with source_dir, so the relative path is a slice
+    prefix_len = len(os.path.join(source_dir, ''))
+    if files is None:
+        # Process all markdown files in source directory
+        entries = [(entry.path, entry.path[prefix_len:], entry.stat().st_mtime)
+                   for entry in walk_markdown(source_dir)]
+    else:
+        entries = [(file_path, file_path[prefix_len:], os.stat(file_path).st_mtime) for file_path in files]
+    
+    # Create each target subdirectory once rather than once per file
+    target_dirs = {target_dir + os.sep + relative_path.rpartition(os.sep)[0] for _, relative_path, _ in entries}
+    for directory in target_dirs:
+        os.makedirs(directory, exist_ok=True)
+    
+    # Each file is an independent, I/O-bound read-merge-write, so threads
+    # overlap the syscalls; small batches skip the pool startup cost
+    if len(entries) < MIN_PARALLEL_FILES:
+        written = sum(_sync_one(file_path, relative_path, source_mtime, target_dir, platform)
+                      for file_path, relative_path, source_mtime in entries)
+    else:
+        from concurrent.futures import ThreadPoolExecutor  # Only needed for large batches
         
-        print(f"Synced: {relative_path} -> {target_path}")
+        sync_one = functools.partial(_sync_one, target_dir=target_dir, platform=platform)
+        with ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4) as pool:
+            written = sum(pool.map(sync_one, *zip(*entries)))
+    
+    log.info("Synced %d files to %s, %d unchanged", written, platform, len(entries) - written)
+
+def _fastcopy(src, dst):
+    """Copy file contents in the kernel where possible, falling back to buffered copying."""
+    with open(src, 'rb') as s, open(dst, 'wb') as d:
+        size = os.fstat(s.fileno()).st_size
+        try:
+            copied = 0
+            while copied < size:
+                n = os.copy_file_range(s.fileno(), d.fileno(), size - copied)
+                if n == 0:
+                    break
+                copied += n
+        except (AttributeError, OSError):
+            # copy_file_range is Linux-only and not supported by every filesystem
+            s.seek(0)
+            d.seek(0)
+            d.truncate()
+            shutil.copyfileobj(s, d, 1 << 20)
 
 def sync_assets(content_dir, platform_dirs):
     """Sync assets to all platform directories."""
     assets_source = os.path.join(content_dir, "assets")
     if not os.path.exists(assets_source):
         return
-        
+    
+    copied = []
+    
+    def copy_asset(src, dst):
+        # Copies keep the source mtime, so a matching mtime and size means the asset is current
+        src_stat = os.stat(src)
+        try:
+            dst_stat = os.stat(dst)
+        except FileNotFoundError:
+            dst_stat = None
+        if (dst_stat is None or dst_stat.st_mtime_ns != src_stat.st_mtime_ns
+                or dst_stat.st_size != src_stat.st_size):
+            _fastcopy(src, dst)
+            shutil.copystat(src, dst)
+            copied.append(dst)
+            log.debug("Synced asset: %s", os.path.relpath(src, assets_source))
+        return dst
+    
     for platform_dir in platform_dirs:
         assets_target = os.path.join(platform_dir, "assets")
-        os.makedirs(assets_target, exist_ok=True)
+        copied.clear()
         
-        # Copy all assets
-        for asset in glob.glob(os.path.join(assets_source, "**"), recursive=True):
-            if os.path.isfile(asset):
-                relative_path = os.path.relpath(asset, assets_source)
-                target_path = os.path.join(assets_target, relative_path)
-                os.makedirs(os.path.dirname(target_path), exist_ok=True)
-                shutil.copy2(asset, target_path)
-                print(f"Synced asset: {relative_path}")
+        # Skip hidden files and folders such as .DS_Store
+        shutil.copytree(assets_source, assets_target, dirs_exist_ok=True,
+                        ignore=shutil.ignore_patterns('.*'), copy_function=copy_asset)
+        log.info("Synced %d assets to %s", len(copied), assets_target)
 
 def get_modified_files(repo_path, since_commit=None):
-    """Get files modified since the given commit."""
-    repo = git.Repo(repo_path)
+    """Get absolute paths of markdown files modified since the given commit, plus untracked ones."""
+    import git  # pip install GitPython; slow to import, so only loaded for incremental syncs
+    
+    repo = git.Repo(repo_path, search_parent_directories=True)
     
     if since_commit:
         # Get modified files since the specified commit
@@ -213,7 +406,12 @@ def get_modified_files(repo_path, since_commit=None):
         # Get modified files in working directory
         diff = repo.git.diff('--name-only')
     
-    return [f for f in diff.split('\n') if f.endswith('.md')]
+    # New notes never show up in a diff, so add untracked files that aren't ignored
+    untracked = repo.git.ls_files('--others', '--exclude-standard', '--full-name')
+    
+    # git reports paths relative to the top of the work tree
+    paths = dict.fromkeys(diff.split('\n') + untracked.split('\n'))
+    return [os.path.join(repo.working_tree_dir, f) for f in paths if f.endswith('.md')]
 
 def main():
     parser = argparse.ArgumentParser(description='Sync notes between Logseq, Obsidian, and Quarto')
@@ -225,8 +423,18 @@ def main():
                         help='Only sync files modified since last sync')
     parser.add_argument('--since-commit', 
                         help='Only sync files modified since specified commit')
+    parser.add_argument('--verbose', action='store_true',
+                        help='Log each synced file')
     args = parser.parse_args()
     
+    # Per-file lines are logged at DEBUG, so only this script's logger is made more verbose
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    log.setLevel(logging.DEBUG if args.verbose else logging.INFO)
+    
+    # Reuse parsed frontmatter from the last run, and persist it for the next one even if the sync fails partway
+    load_fm_cache()
+    atexit.register(save_fm_cache)
+    
     # Default sync behavior: from content to all platforms
     source = args.source or 'content'
     target = args.target or 'all'
@@ -237,21 +445,30 @@ def main():
     else:
         source_dir = CONFIG[source]['publish_dir']
     
+    # Limit the sync to changed files under the source directory if requested
+    files = None
+    if args.modified_only or args.since_commit:
+        source_root = os.path.abspath(source_dir)
+        files = [os.path.join(source_dir, os.path.relpath(f, source_root))
+                 for f in get_modified_files('.', since_commit=args.since_commit)
+                 if os.path.commonpath([f, source_root]) == source_root and os.path.isfile(f)]
+        log.info("Found %d modified files in %s", len(files), source_dir)
+    
     if target == 'all':
         # Sync to all platforms
         for platform in ['logseq', 'obsidian', 'quarto']:
-            print(f"Syncing to {platform}...")
-            sync_files(source_dir, CONFIG[platform]['publish_dir'], platform)
+            log.info("Syncing to %s...", platform)
+            sync_files(source_dir, CONFIG[platform]['publish_dir'], platform, files=files)
     else:
         # Sync to specific platform
-        sync_files(source_dir, CONFIG[target]['publish_dir'], target)
+        sync_files(source_dir, CONFIG[target]['publish_dir'], target, files=files)
     
     # Sync assets to all platforms or specified target
     platform_dirs = [CONFIG[p]['publish_dir'] for p in ['logseq', 'obsidian', 'quarto']] \
                    if target == 'all' else [CONFIG[target]['publish_dir']]
     sync_assets(CONFIG['logseq']['content_dir'], platform_dirs)
     
-    print("Sync completed!")
+    log.info("Sync completed!")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
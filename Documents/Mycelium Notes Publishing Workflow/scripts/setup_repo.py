@@ -7,9 +7,28 @@ supporting Logseq, Obsidian, and Quarto.
 """
 
 import os
+import re
+import sys
 import shutil
 import argparse
-import subprocess
+
+def make_directories(base_dir, directories):
+    """Create directories under base_dir, once each, skipping parents that a deeper directory creates anyway."""
+    unique = {os.path.normpath(directory) for directory in directories}
+    leaves = [directory for directory in unique
+              if not any(other.startswith(directory + os.sep) for other in unique)]
+    for directory in sorted(leaves):
+        os.makedirs(os.path.join(base_dir, directory), exist_ok=True)
+
+def _write_text(path, text):
+    """Write text to a file as UTF-8."""
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(text)
+
+def write_files(base_dir, files):
+    """Write (relative path, text) pairs under base_dir."""
+    for name, text in files:
+        _write_text(os.path.join(base_dir, name), text)
 
 def create_directory_structure(base_dir):
     """Create the directory structure for the notes publishing workflow."""
@@ -33,8 +52,8 @@ def create_directory_structure(base_dir):
         "scripts"
     ]
     
+    make_directories(base_dir, directories)
     for directory in directories:
-        os.makedirs(os.path.join(base_dir, directory), exist_ok=True)
         print(f"Created directory: {directory}")
 
 def create_readme(base_dir):
@@ -81,8 +100,7 @@ To set up the repository:
 4. Start creating notes!
 """
     
-    with open(os.path.join(base_dir, "README.md"), "w", encoding="utf-8") as f:
-        f.write(readme_content)
+    write_files(base_dir, [("README.md", readme_content)])
     print("Created README.md")
 
 def create_quarto_config(base_dir):
@@ -109,9 +127,6 @@ execute:
   freeze: auto
 """
     
-    with open(os.path.join(base_dir, "quarto", "_quarto.yml"), "w", encoding="utf-8") as f:
-        f.write(quarto_config)
-    
     # Create basic index and about files
     index_content = """---
 title: "Notes"
@@ -134,18 +149,16 @@ title: "About"
 About this notes collection.
 """
     
-    with open(os.path.join(base_dir, "quarto", "index.qmd"), "w", encoding="utf-8") as f:
-        f.write(index_content)
-    
-    with open(os.path.join(base_dir, "quarto", "about.qmd"), "w", encoding="utf-8") as f:
-        f.write(about_content)
-    
     # Create styles.css
     styles_content = """/* Custom styles */
 """
     
-    with open(os.path.join(base_dir, "quarto", "styles.css"), "w", encoding="utf-8") as f:
-        f.write(styles_content)
+    write_files(base_dir, [
+        (os.path.join("quarto", "_quarto.yml"), quarto_config),
+        (os.path.join("quarto", "index.qmd"), index_content),
+        (os.path.join("quarto", "about.qmd"), about_content),
+        (os.path.join("quarto", "styles.css"), styles_content),
+    ])
     
     print("Created Quarto configuration files")
 
@@ -164,11 +177,10 @@ def create_obsidian_config(base_dir):
     
     os.makedirs(os.path.join(base_dir, "obsidian", ".obsidian"), exist_ok=True)
     
-    with open(os.path.join(base_dir, "obsidian", ".obsidian", "app.json"), "w", encoding="utf-8") as f:
-        f.write(app_json)
-    
-    with open(os.path.join(base_dir, "obsidian", ".obsidian", "appearance.json"), "w", encoding="utf-8") as f:
-        f.write(appearance_json)
+    write_files(base_dir, [
+        (os.path.join("obsidian", ".obsidian", "app.json"), app_json),
+        (os.path.join("obsidian", ".obsidian", "appearance.json"), appearance_json),
+    ])
     
     print("Created Obsidian configuration files")
 
@@ -188,8 +200,7 @@ def create_logseq_config(base_dir):
     
     os.makedirs(os.path.join(base_dir, "logseq"), exist_ok=True)
     
-    with open(os.path.join(base_dir, "logseq", "config.edn"), "w", encoding="utf-8") as f:
-        f.write(config_edn)
+    write_files(base_dir, [(os.path.join("logseq", "config.edn"), config_edn)])
     
     print("Created Logseq configuration files")
 
@@ -215,6 +226,34 @@ def copy_scripts(base_dir):
     
     print("Copied scripts to scripts/ directory")
 
+def copy_file(src, dst):
+    """Copy a file's contents and timestamps, keeping the bytes in the kernel where possible."""
+    st = os.stat(src)
+    if os.path.exists(dst) and os.path.samefile(src, dst):
+        # dst is a hardlink to src (e.g. from an older setup run); truncating it would empty src,
+        # so unlink it and make an independent copy
+        os.remove(dst)
+    src_fd = os.open(src, os.O_RDONLY)
+    try:
+        dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, st.st_mode & 0o777)
+        try:
+            offset = 0
+            while offset < st.st_size:
+                sent = os.sendfile(dst_fd, src_fd, offset, st.st_size - offset)
+                if sent == 0:
+                    break
+                offset += sent
+        except (AttributeError, OSError):
+            # sendfile is unavailable on Windows and needs a socket target on macOS
+            shutil.copyfile(src, dst)
+        finally:
+            os.close(dst_fd)
+    finally:
+        os.close(src_fd)
+    # The open() mode only applies to new files, and the umask masks it, so copy it as copy2 would
+    shutil.copymode(src, dst)
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+
 def copy_github_workflow(base_dir):
     """Copy the GitHub Actions workflow files."""
     script_dir = os.path.dirname(os.path.abspath(__file__))
@@ -223,25 +262,19 @@ def copy_github_workflow(base_dir):
     workflows_dir = os.path.join(base_dir, ".github", "workflows")
     os.makedirs(workflows_dir, exist_ok=True)
     
-    # Copy workflow files
-    workflow_files = [
+    # Real copies, since an in-place edit of a hardlink would change the template too
+    workflow_files = (
         "sync-notes.yml",
         "logseq_publish.yml",
         "obsidian_publish.yml", 
         "quarto_publish.yml"
-    ]
-    
-    for workflow_file in workflow_files:
-        shutil.copy2(
-            os.path.join(script_dir, workflow_file),
-            os.path.join(workflows_dir, workflow_file)
-        )
-    
-    # Copy publishing config
-    shutil.copy2(
-        os.path.join(script_dir, "publishing_config.yml"),
-        os.path.join(base_dir, "publishing_config.yml")
     )
+    for name in workflow_files:
+        copy_file(os.path.join(script_dir, name), os.path.join(workflows_dir, name))
+    
+    # Copy the publishing configuration
+    copy_file(os.path.join(script_dir, "publishing_config.yml"),
+              os.path.join(base_dir, "publishing_config.yml"))
     
     print("Copied GitHub Actions workflow files and publishing configuration")
 
@@ -271,15 +304,65 @@ This is a sample note to demonstrate the notes publishing workflow.
 
 """
     
-    with open(os.path.join(base_dir, "content", "notes", "sample-note.md"), "w", encoding="utf-8") as f:
-        f.write(sample_note)
+    write_files(base_dir, [(os.path.join("content", "notes", "sample-note.md"), sample_note)])
     
     print("Created sample note")
 
+def write_git_skeleton(git_dir):
+    """Write the files and directories git needs to recognize an empty repository on main."""
+    for directory in ("objects/info", "objects/pack", "refs/heads", "refs/tags"):
+        os.makedirs(os.path.join(git_dir, directory))
+    with open(os.path.join(git_dir, "HEAD"), "w", encoding="utf-8") as f:
+        f.write("ref: refs/heads/main\n")
+    with open(os.path.join(git_dir, "config"), "w", encoding="utf-8") as f:
+        f.write("[core]\n"
+                "\trepositoryformatversion = 0\n"
+                f"\tfilemode = {'false' if os.name == 'nt' else 'true'}\n"
+                "\tbare = false\n"
+                "\tlogallrefupdates = true\n")
+
+def git_init_is_configured():
+    """Check whether any git config or environment could change what `git init` writes.
+    
+    Any template directory, default branch or include in the system or global config counts,
+    as does a platform where git probes the filesystem (core.ignorecase, core.precomposeunicode).
+    """
+    if os.name == "nt" or sys.platform == "darwin":
+        return True
+    if any(name == "GIT_TEMPLATE_DIR" or name.startswith("GIT_CONFIG") for name in os.environ):
+        return True
+    xdg_config = os.environ.get("XDG_CONFIG_HOME") or os.path.join(os.path.expanduser("~"), ".config")
+    config_files = ["/etc/gitconfig",
+                    os.path.join(xdg_config, "git", "config"),
+                    os.path.join(os.path.expanduser("~"), ".gitconfig")]
+    for config_file in config_files:
+        try:
+            with open(config_file, "r", encoding="utf-8", errors="replace") as f:
+                config = f.read()
+        except OSError:
+            continue
+        if re.search(r"^\s*\[\s*(init|include)", config, re.IGNORECASE | re.MULTILINE):
+            return True
+    return False
+
 def init_git_repo(base_dir):
     """Initialize a Git repository if one doesn't already exist."""
-    if not os.path.exists(os.path.join(base_dir, ".git")):
-        subprocess.run(["git", "init"], cwd=base_dir, check=True)
+    git_dir = os.path.join(base_dir, ".git")
+    if not os.path.exists(git_dir):
+        # Writing the skeleton directly saves running git, but only matches `git init` when nothing configures it
+        use_git = git_init_is_configured()
+        if not use_git:
+            try:
+                write_git_skeleton(git_dir)
+                # A case-insensitive filesystem needs core.ignorecase, which git sets by probing like this
+                use_git = os.path.exists(os.path.join(git_dir, "CoNfIg"))
+            except OSError:
+                use_git = True
+            if use_git:
+                shutil.rmtree(git_dir, ignore_errors=True)
+        if use_git:
+            import subprocess  # Only needed when git itself has to run
+            subprocess.run(["git", "init"], cwd=base_dir, check=True)
         print("Initialized Git repository")
     else:
         print("Git repository already exists")
@@ -339,8 +422,7 @@ _site/
 *.log
 """
     
-    with open(os.path.join(base_dir, ".gitignore"), "w", encoding="utf-8") as f:
-        f.write(gitignore_content)
+    write_files(base_dir, [(".gitignore", gitignore_content)])
     print("Created .gitignore file")
 
 def setup_custom_domains(base_dir):
@@ -352,9 +434,10 @@ def setup_custom_domains(base_dir):
         "quarto": "notes-quarto.yourdomain.com"
     }
     
-    for platform, domain in domains.items():
-        with open(os.path.join(base_dir, f"{platform}/CNAME"), "w", encoding="utf-8") as f:
-            f.write(domain)
+    # The CNAMEs live in each platform's folder, which may not exist yet
+    make_directories(base_dir, domains)
+    
+    write_files(base_dir, [(f"{platform}/CNAME", domain) for platform, domain in domains.items()])
     
     print("Created CNAME files for custom domains")
 
@@ -395,12 +478,12 @@ def main():
     # Create sample note
     create_sample_note(base_dir)
     
-    # Initialize Git repository
-    init_git_repo(base_dir)
-    
     # Create .gitignore
     create_gitignore(base_dir)
     
+    # Initialize Git repository once the tree is in place
+    init_git_repo(base_dir)
+    
     print(f"\nRepository setup complete at {base_dir}")
     print("\nNext steps:")
     print(f"1. Update domains in publishing_config.yml with your actual custom domains")
@@ -8,11 +8,36 @@ This utility handles the transformation of YAML frontmatter between different pl
 - Quarto: Publication-ready frontmatter (title, format, date, categories)
 """
 
+import os
+import sys
+import glob
 import re
-import yaml
+import json
+import mmap
+import atexit
+import shutil
+import secrets
 import argparse
 from pathlib import Path
-from datetime import datetime
+from datetime import date, datetime
+
+# Parsed frontmatter from previous runs, keyed by absolute path and checked against [mtime_ns, size]
+FRONTMATTER_CACHE_FILE = '.frontmatter_cache.json'
+# Bumped whenever the meaning of a cache entry changes (2: body offsets are in bytes)
+FRONTMATTER_CACHE_VERSION = 2
+
+# Notes larger than this are memory-mapped rather than read into memory
+MMAP_THRESHOLD = 65536
+
+# Today's date as written into frontmatter, formatted once per run
+_TODAY_STR = None
+
+def _today():
+    """Return the run's date as YYYY-MM-DD, fixed the first time it is needed."""
+    global _TODAY_STR
+    if _TODAY_STR is None:
+        _TODAY_STR = datetime.now().strftime('%Y-%m-%d')
+    return _TODAY_STR
 
 # Platform-specific transformations
 TRANSFORMATIONS = {
@@ -20,13 +45,13 @@ TRANSFORMATIONS = {
         'title': lambda x: x,  # Keep as is
         'type': lambda x: None,  # Remove type
         'tags': lambda x: x.split(',') if isinstance(x, str) else x,  # Convert to list if string
-        'created': lambda x: x if x else datetime.now().strftime('%Y-%m-%d')  # Set current date if missing
+        'created': lambda x: x if x else _today()  # Set current date if missing
     },
     'logseq_to_quarto': {
         'title': lambda x: x,  # Keep as is
         'type': lambda x: None,  # Remove type
         'format': lambda x: 'html',  # Default format
-        'date': lambda x: datetime.now().strftime('%Y-%m-%d'),  # Current date
+        'date': lambda x: _today(),  # Current date
         'categories': lambda x: []  # Empty categories
     },
     'obsidian_to_logseq': {
@@ -40,7 +65,7 @@ TRANSFORMATIONS = {
         'tags': lambda x: None,  # Remove tags
         'created': lambda x: None,  # Remove created
         'format': lambda x: 'html',  # Default format
-        'date': lambda x, meta: meta.get('created', datetime.now().strftime('%Y-%m-%d')),  # Use created date or current
+        'date': lambda x, meta: meta.get('created', _today()),  # Use created date or current
         'categories': lambda x, meta: meta.get('tags', [])  # Use tags as categories
     },
     'quarto_to_logseq': {
@@ -56,28 +81,141 @@ TRANSFORMATIONS = {
         'date': lambda x: None,  # Remove date
         'categories': lambda x: None,  # Remove categories
         'tags': lambda x, meta: meta.get('categories', []),  # Use categories as tags
-        'created': lambda x, meta: meta.get('date', datetime.now().strftime('%Y-%m-%d'))  # Use date as created
+        'created': lambda x, meta: meta.get('date', _today())  # Use date as created
     }
 }
 
+class _Rule:
+    """One key's transformation, with its calling convention worked out once instead of per key per file.
+    
+    Two-argument functions also receive the whole source frontmatter; one-argument
+    functions double as default value generators when the key is missing.
+    """
+    __slots__ = ('key', 'func', 'takes_meta')
+    
+    def __init__(self, key, func):
+        self.key = key
+        self.func = func
+        self.takes_meta = func.__code__.co_argcount == 2
+
+TRANSFORMATION_PLANS = {
+    name: tuple(_Rule(key, func) for key, func in transformations.items())
+    for name, transformations in TRANSFORMATIONS.items()
+}
+
+def _encode_date(value):
+    """Encode YAML dates and timestamps, which JSON has no type for."""
+    if isinstance(value, datetime):
+        return {'__datetime__': value.isoformat()}
+    if isinstance(value, date):
+        return {'__date__': value.isoformat()}
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def _decode_date(obj):
+    """Decode dates and timestamps written by _encode_date."""
+    if len(obj) == 1:
+        if '__datetime__' in obj:
+            return datetime.fromisoformat(obj['__datetime__'])
+        if '__date__' in obj:
+            return date.fromisoformat(obj['__date__'])
+    return obj
+
+# Loaded by main(), so importing this module never reads files from the working directory
+_frontmatter_cache = {}
+_frontmatter_cache_dirty = False
+
+def load_frontmatter_cache():
+    """Load the parsed frontmatter cache from the previous run, ignoring it if malformed or outdated."""
+    global _frontmatter_cache
+    try:
+        with open(FRONTMATTER_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f, object_hook=_decode_date)
+    except (OSError, ValueError):
+        return
+    if isinstance(cache, dict) and cache.get('version') == FRONTMATTER_CACHE_VERSION and isinstance(cache.get('files'), dict):
+        _frontmatter_cache = cache['files']
+
+def save_frontmatter_cache():
+    """Atomically write the parsed frontmatter cache if it changed."""
+    if not _frontmatter_cache_dirty:
+        return
+    temp_file = FRONTMATTER_CACHE_FILE + '.tmp'
+    with open(temp_file, 'w', encoding='utf-8') as f:
+        json.dump({'version': FRONTMATTER_CACHE_VERSION, 'files': _frontmatter_cache}, f, default=_encode_date)
+    os.replace(temp_file, FRONTMATTER_CACHE_FILE)
+
+def read_bytes(file_path):
+    """Read a file's bytes with newlines normalized to \\n, as text mode would.
+    
+    Large files without carriage returns are returned as a read-only memory map, so the
+    kernel pages them in on demand instead of copying them. Not on Windows, where a
+    mapped file can't be replaced by the transformed one.
+    """
+    with open(file_path, 'rb') as f:
+        if os.name != 'nt' and os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if mapped.find(b'\r') == -1:
+                return mapped
+            mapped.close()
+        data = f.read()
+    if b'\r' in data:
+        data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+    return data
+
+def _tail(data, start):
+    """Slice data from start to the end, without copying if it is memory-mapped."""
+    if isinstance(data, mmap.mmap):
+        return memoryview(data)[start:]
+    return data[start:]
+
 def read_file(file_path):
-    """Read a markdown file and extract the YAML frontmatter."""
-    with open(file_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Check for YAML frontmatter
-    yaml_match = re.match(r'^---\n(.*?)\n---\n', content, re.DOTALL)
-    if yaml_match:
-        yaml_text = yaml_match.group(1)
+    """Read a markdown file and extract the YAML frontmatter, reusing the cached result if the file is unchanged.
+    
+    Returns (frontmatter, content), where content is the UTF-8 body as bytes (a memoryview
+    for memory-mapped files); it is only passed through to write_file, so it is never decoded.
+    """
+    global _frontmatter_cache_dirty
+    key = os.path.abspath(file_path)
+    st = os.stat(file_path)
+    stamp = [st.st_mtime_ns, st.st_size]
+    
+    cached = _frontmatter_cache.get(key)
+    if cached is not None and cached[0] == stamp:
+        # Only the body is needed; it starts at the cached offset
+        return cached[1], _tail(read_bytes(file_path), cached[2])
+    
+    frontmatter, content, offset = parse_file(file_path)
+    
+    # Only cache frontmatter that survives the JSON round trip unchanged (e.g. no non-string keys)
+    entry = [stamp, frontmatter, offset]
+    try:
+        cacheable = json.loads(json.dumps(entry, default=_encode_date), object_hook=_decode_date) == entry
+    except (TypeError, ValueError):
+        cacheable = False
+    if cacheable:
+        _frontmatter_cache[key] = entry
+        _frontmatter_cache_dirty = True
+    
+    return frontmatter, content
+
+def parse_file(file_path):
+    """Read a markdown file and extract the YAML frontmatter, returning (frontmatter, content_bytes, content_offset)."""
+    data = read_bytes(file_path)
+    
+    # Check for YAML frontmatter; only that slice is decoded
+    end = data.find(b'\n---\n', 4) if data[:4] == b'---\n' else -1
+    if end != -1:
+        import yaml  # Only needed for frontmatter that isn't cached
         try:
-            frontmatter = yaml.safe_load(yaml_text)
-            remaining_content = content[yaml_match.end():]
-            return frontmatter, remaining_content
+            # Use the LibYAML parser when available
+            frontmatter = yaml.load(data[4:end].decode('utf-8'),
+                                    Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+            return frontmatter, _tail(data, end + 5), end + 5
         except yaml.YAMLError:
             pass
     
     # No valid frontmatter
-    return {}, content
+    return {}, _tail(data, 0), 0
 
 def transform_frontmatter(frontmatter, source_platform, target_platform):
     """Transform frontmatter from source platform to target platform."""
@@ -89,61 +227,260 @@ def transform_frontmatter(frontmatter, source_platform, target_platform):
     transformations = TRANSFORMATIONS[transform_key]
     
     # Apply transformations
-    for key, transform_func in transformations.items():
+    for rule in TRANSFORMATION_PLANS[transform_key]:
+        key = rule.key
         if key in frontmatter:
-            try:
-                # Some transformation functions might need the whole metadata
-                result = transform_func(frontmatter[key], frontmatter)
-            except TypeError:
-                # If the function doesn't accept the metadata, call it with just the value
-                result = transform_func(frontmatter[key])
+            # Some transformation functions need the whole metadata
+            if rule.takes_meta:
+                result = rule.func(frontmatter[key], frontmatter)
+            else:
+                result = rule.func(frontmatter[key])
                 
             if result is not None:  # None means remove the key
                 transformed[key] = result
-        elif transform_func.__code__.co_argcount == 1:
+        elif not rule.takes_meta:
             # Function with single argument is a default value generator
-            result = transform_func(None)
+            result = rule.func(None)
             if result is not None:
                 transformed[key] = result
     
-    # Copy any other keys not specifically transformed
-    for key, value in frontmatter.items():
-        if key not in transformations and key not in transformed:
-            transformed[key] = value
+    # Copy any other keys not specifically transformed; transformed only ever
+    # holds transformation keys, so checking those alone is enough
+    transformed.update((key, value) for key, value in frontmatter.items() if key not in transformations)
     
     return transformed
 
+# Strings that yaml.dump writes as-is: ASCII words separated by single spaces, no indicators,
+# and nothing that would read back as a bool or null
+_PLAIN_SCALAR_RE = re.compile(r'[A-Za-z][A-Za-z0-9_.\-]*(?: [A-Za-z0-9_.\-]+)*\Z')
+_IMPLICIT_WORDS = frozenset(
+    word for base in ('yes', 'no', 'true', 'false', 'on', 'off', 'null')
+    for word in (base, base.capitalize(), base.upper())
+)
+# yaml.dump folds lines longer than this
+_MAX_PLAIN_LINE = 80
+# yaml.dump writes longer mapping keys as "? key" complex keys
+_MAX_SIMPLE_KEY = 128
+
+def _plain(value):
+    """Return value as yaml.dump would write it unquoted, or None if it needs the full emitter."""
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int) or (isinstance(value, date) and not isinstance(value, datetime)):
+        return str(value)
+    if isinstance(value, str) and value not in _IMPLICIT_WORDS and _PLAIN_SCALAR_RE.match(value):
+        return value
+    return None
+
+def _fast_dump(frontmatter):
+    """Format frontmatter exactly as yaml.dump does, by hand for the common scalar and string-list values.
+    
+    Anything the hand-written path can't reproduce byte for byte (quoting, folding, complex
+    keys, anchors and aliases) is left to yaml.dump.
+    """
+    lines = []
+    # Lists and dates (unlike str and int) are written with an anchor and alias when the
+    # same object appears twice, so any repeat sends the whole mapping to yaml.dump
+    seen = set()
+    for key, value in frontmatter.items() if isinstance(frontmatter, dict) else ():
+        name = _plain(key) if isinstance(key, str) and len(key) <= _MAX_SIMPLE_KEY else None
+        if name is None:
+            break
+        if isinstance(value, (list, date)):
+            if id(value) in seen:
+                break
+            seen.add(id(value))
+        if isinstance(value, list):
+            if not value:
+                lines.append(f"{name}: []")
+                continue
+            dates = [id(item) for item in value if isinstance(item, date)]
+            if not seen.isdisjoint(dates) or len(set(dates)) != len(dates):
+                break
+            seen.update(dates)
+            items = [_plain(item) for item in value]
+            if None in items or max(len(item) for item in items) + 2 > _MAX_PLAIN_LINE:
+                break
+            lines.append(f"{name}:")
+            lines.extend(f"- {item}" for item in items)
+        else:
+            text = _plain(value)
+            if text is None or len(name) + len(text) + 2 > _MAX_PLAIN_LINE:
+                break
+            lines.append(f"{name}: {text}")
+    else:
+        if lines:
+            return "\n".join(lines) + "\n"
+    
+    # Anything else (nested mappings, quoting, long or non-ASCII text) goes through PyYAML
+    import yaml  # Only needed when the fast path can't format the frontmatter
+    return yaml.dump(frontmatter, Dumper=getattr(yaml, 'CSafeDumper', yaml.SafeDumper),
+                     default_flow_style=False, sort_keys=False)
+
+def _create_temp_file(directory, name):
+    """Create a uniquely named temporary file next to name, with the permissions open() would give it."""
+    while True:
+        temp_path = os.path.join(directory, f".{name}.{secrets.token_hex(6)}.tmp")
+        try:
+            # Unlike mkstemp's 0600, 0666 lets the umask decide, as for any new file
+            return os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0),
+                           0o666), temp_path
+        except FileExistsError:
+            continue
+
 def write_file(file_path, frontmatter, content):
-    """Write frontmatter and content to a file."""
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write('---\n')
-        yaml.dump(frontmatter, f, default_flow_style=False, sort_keys=False)
-        f.write('---\n\n')
-        f.write(content)
+    """Atomically write frontmatter and content (UTF-8 bytes-like, or str) to a file."""
+    header = f"---\n{_fast_dump(frontmatter)}---\n\n".encode('utf-8')
+    if isinstance(content, str):
+        content = content.encode('utf-8')
+    
+    # Write through symlinks so the link itself is kept
+    target_path = os.path.realpath(file_path)
+    try:
+        st = os.stat(target_path)
+    except FileNotFoundError:
+        st = None
+    
+    if st is not None and st.st_nlink > 1:
+        # Replacing a hardlinked file would split it from its other names, so rewrite it in
+        # place; the body may be mapped from this very file, so copy it out before truncating
+        content = bytes(content)
+        with open(target_path, 'wb') as f:
+            f.write(header)
+            f.write(content)
+        return
+    
+    # Write to a unique temporary file, then swap it in so readers never see a partial file;
+    # the body bytes go straight through without being copied into one payload
+    fd, temp_path = _create_temp_file(os.path.dirname(target_path) or '.', os.path.basename(target_path))
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(header)
+            f.write(content)
+            temp_stat = os.fstat(f.fileno())
+        if st is not None:
+            # Keep the original file's permissions and, where allowed, its owner
+            shutil.copymode(target_path, temp_path)
+            if hasattr(os, 'chown') and (st.st_uid, st.st_gid) != (temp_stat.st_uid, temp_stat.st_gid):
+                try:
+                    os.chown(temp_path, st.st_uid, st.st_gid)
+                except OSError:
+                    pass
+        os.replace(temp_path, target_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
 
-def transform_file(file_path, source_platform, target_platform, output_path=None):
-    """Transform a file from one platform to another."""
+def _transform(file_path, source_platform, target_platform, output_path=None):
+    """Transform a file, returning (output_path, written)."""
     if output_path is None:
         output_path = file_path
     
     frontmatter, content = read_file(file_path)
     transformed = transform_frontmatter(frontmatter, source_platform, target_platform)
+    
+    # Rewriting a file in place with the frontmatter it already has would only reformat it
+    if transformed == frontmatter and output_path == file_path:
+        return output_path, False
+    
     write_file(output_path, transformed, content)
+    return output_path, True
+
+def transform_file(file_path, source_platform, target_platform, output_path=None):
+    """Transform a file from one platform to another."""
+    return _transform(file_path, source_platform, target_platform, output_path)[0]
+
+def _try_transform(file_path, source_platform, target_platform, output_path=None):
+    """Transform a file, returning (output_path, written, error) instead of raising."""
+    try:
+        return (*_transform(file_path, source_platform, target_platform, output_path), None)
+    except Exception as e:
+        return output_path or file_path, False, e
+
+def transform_files(file_paths, source_platform, target_platform):
+    """Transform many files in place, returning (output_path, written, error) triples in order.
+    
+    A file that can't be transformed doesn't stop the others; its error is returned instead.
+    """
+    if len(file_paths) < 2:
+        return [_try_transform(file_path, source_platform, target_platform) for file_path in file_paths]
     
-    return output_path
+    from concurrent.futures import ThreadPoolExecutor  # Only needed for batches
+    
+    # Each file is an independent read-transform-write, so threads overlap the file I/O
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+        return list(pool.map(lambda file_path: _try_transform(file_path, source_platform, target_platform),
+                             file_paths))
+
+def expand_inputs(patterns, batch_file=None):
+    """Expand input paths and glob patterns, plus any paths listed one per line in batch_file."""
+    if batch_file:
+        with open(batch_file, 'r', encoding='utf-8') as f:
+            patterns = patterns + [line.strip() for line in f if line.strip()]
+    
+    file_paths = []
+    for pattern in patterns:
+        # Existing paths are taken literally (e.g. "[draft].md"), and only arguments with glob
+        # characters are expanded; anything else is kept so a missing file is still reported
+        if os.path.exists(pattern) or not glob.has_magic(pattern):
+            file_paths.append(pattern)
+        else:
+            file_paths.extend(sorted(glob.glob(pattern, recursive=True)) or [pattern])
+    
+    # The same file under two spellings (a.md, ./a.md) would be transformed twice at once
+    unique = {}
+    for file_path in file_paths:
+        unique.setdefault(os.path.realpath(file_path), file_path)
+    return list(unique.values())
 
 def main():
     parser = argparse.ArgumentParser(description='Transform YAML frontmatter between platforms')
-    parser.add_argument('file', help='Input file path')
+    parser.add_argument('files', nargs='*', metavar='file',
+                        help='Input file paths or glob patterns (e.g. "notes/**/*.md")')
+    parser.add_argument('--batch', metavar='FILE_LIST',
+                        help='Text file listing input paths or patterns, one per line')
     parser.add_argument('--source', choices=['logseq', 'obsidian', 'quarto'], required=True,
                         help='Source platform')
     parser.add_argument('--target', choices=['logseq', 'obsidian', 'quarto'], required=True,
                         help='Target platform')
-    parser.add_argument('--output', help='Output file path (default: overwrite input)')
+    parser.add_argument('--output', help='Output file path (default: overwrite input; single file only)')
     args = parser.parse_args()
     
-    output_path = transform_file(args.file, args.source, args.target, args.output)
-    print(f"Transformed {args.file} from {args.source} to {args.target} format. Output: {output_path}")
+    # Reuse parsed frontmatter from the last run, and persist it for the next one even if a transform fails partway
+    load_frontmatter_cache()
+    atexit.register(save_frontmatter_cache)
+    
+    # Every file in the batch gets the date the run started on, even past midnight
+    _today()
+    
+    file_paths = expand_inputs(args.files, args.batch)
+    if not file_paths:
+        parser.error('no input files given')
+    
+    if args.output:
+        if len(file_paths) > 1:
+            parser.error('--output can only be used with a single input file')
+        results = [_try_transform(file_paths[0], args.source, args.target, args.output)]
+    else:
+        results = transform_files(file_paths, args.source, args.target)
+    
+    for file_path, (output_path, written, error) in zip(file_paths, results):
+        if error is not None:
+            print(f"Error transforming {file_path}: {error}")
+        elif written:
+            print(f"Transformed {file_path} from {args.source} to {args.target} format. Output: {output_path}")
+        else:
+            print(f"Unchanged {file_path}: frontmatter is already in {args.target} format")
+    
+    failed = sum(error is not None for _, _, error in results)
+    if len(results) > 1:
+        written = sum(written for _, written, _ in results)
+        print(f"Transformed {written} files, {len(results) - written - failed} unchanged, {failed} failed")
+    if failed:
+        sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -0,0 +1,34 @@
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import bidirectional_sync
+
+
+# A long section with repetitive wording, the kind checklists and templated notes produce
+PHRASE = "the sync merges notes and keeps each field in place for every target"
+SECTION = ((PHRASE + " ") * 8)[:528]
+
+
+class DetermineSyncDirectionTest(unittest.TestCase):
+    def test_small_edit_in_long_section_is_synced(self):
+        words = SECTION.split(" ")
+        words[10] = "altered"
+        edited = " ".join(words)
+
+        directions = bidirectional_sync.determine_sync_direction(
+            {"Summary": edited}, {"Summary": SECTION}, "note")
+
+        self.assertEqual(directions["Summary"], "source_to_target")
+
+    def test_identical_sections_are_left_alone(self):
+        directions = bidirectional_sync.determine_sync_direction(
+            {"Summary": SECTION}, {"Summary": SECTION}, "note")
+
+        self.assertEqual(directions["Summary"], "none")
+
+
+if __name__ == '__main__':
+    unittest.main()
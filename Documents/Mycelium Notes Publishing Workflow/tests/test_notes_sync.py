@@ -0,0 +1,59 @@
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+import subprocess
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'scripts'))
+
+import notes_sync
+
+
+def git(repo, *args):
+    subprocess.run(["git", "-c", "user.name=test", "-c", "user.email=test@example.com", *args],
+                   cwd=repo, check=True, capture_output=True)
+
+
+@unittest.skipIf(shutil.which("git") is None, "git is not installed")
+class GetModifiedFilesTest(unittest.TestCase):
+    def setUp(self):
+        self.repo = os.path.realpath(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, self.repo)
+        os.makedirs(os.path.join(self.repo, "content", "notes"))
+        self.note = os.path.join(self.repo, "content", "notes", "existing.md")
+        with open(self.note, "w", encoding="utf-8") as f:
+            f.write("---\ntitle: Existing\n---\n\nBody\n")
+        git(self.repo, "init", "-q")
+        git(self.repo, "add", "-A")
+        git(self.repo, "commit", "-q", "-m", "Initial notes")
+
+    def test_new_note_is_included(self):
+        new_note = os.path.join(self.repo, "content", "notes", "new.md")
+        with open(new_note, "w", encoding="utf-8") as f:
+            f.write("---\ntitle: New\n---\n\nFresh\n")
+
+        self.assertEqual(notes_sync.get_modified_files(self.repo), [new_note])
+        self.assertEqual(notes_sync.get_modified_files(self.repo, since_commit="HEAD"), [new_note])
+
+    def test_modified_and_new_notes_are_listed_once(self):
+        with open(self.note, "a", encoding="utf-8") as f:
+            f.write("More\n")
+        new_note = os.path.join(self.repo, "content", "notes", "new.md")
+        with open(new_note, "w", encoding="utf-8") as f:
+            f.write("Fresh\n")
+
+        self.assertEqual(sorted(notes_sync.get_modified_files(self.repo)), sorted([self.note, new_note]))
+
+    def test_ignored_notes_are_skipped(self):
+        with open(os.path.join(self.repo, ".gitignore"), "w", encoding="utf-8") as f:
+            f.write("drafts/\n")
+        os.makedirs(os.path.join(self.repo, "drafts"))
+        with open(os.path.join(self.repo, "drafts", "wip.md"), "w", encoding="utf-8") as f:
+            f.write("Draft\n")
+
+        self.assertEqual(notes_sync.get_modified_files(self.repo), [])
+
+
+if __name__ == '__main__':
+    unittest.main()